@@ -19,6 +19,9 @@ package org.trustedanalytics.sparktk.frame.internal.ops.classificationmetrics
 import org.trustedanalytics.sparktk.frame.internal.rdd.{ FrameRdd, ScoreAndLabel }
 import scala.reflect.ClassTag
 import org.apache.spark.rdd.RDD
+import org.json4s.JsonAST.{ JDouble, JNull, JValue }
+import org.json4s.JsonDSL._
+import org.json4s.jackson.JsonMethods._
 
 /**
  * Classification metrics
@@ -33,7 +36,37 @@ case class ClassificationMetricValue(fMeasure: Double,
                                      accuracy: Double,
                                      recall: Double,
                                      precision: Double,
-                                     confusionMatrix: ConfusionMatrix)
+                                     confusionMatrix: ConfusionMatrix) {
+
+  /**
+   * All of the metrics as one JSON object, so python clients can get them with a single py4j call
+   * (confusionMatrix holds rowLabels, columnLabels and the matrix rows, or is null if there is no confusion matrix,
+   * and non-finite metrics are null)
+   */
+  def toJson: String = {
+    val confusionMatrixJson: JValue = if (confusionMatrix == null) {
+      JNull
+    }
+    else {
+      ("rowLabels" -> confusionMatrix.rowLabels.toList) ~
+        ("columnLabels" -> confusionMatrix.columnLabels.toList) ~
+        ("matrix" -> confusionMatrix.getMatrix.map(_.toList).toList)
+    }
+    compact(render(("fMeasure" -> metricJson(fMeasure)) ~
+      ("accuracy" -> metricJson(accuracy)) ~
+      ("recall" -> metricJson(recall)) ~
+      ("precision" -> metricJson(precision)) ~
+      ("confusionMatrix" -> confusionMatrixJson)))
+  }
+
+  /**
+   * JSON has no NaN or Infinity (json4s would write them as strings), so non-finite metrics, like the NaN precision
+   * of an empty frame, are written as null
+   */
+  private def metricJson(value: Double): JValue = {
+    if (value.isNaN || value.isInfinite) JNull else JDouble(value)
+  }
+}
 
 /**
  * Model Accuracy, Precision, Recall, FMeasure, ConfusionMatrix
@@ -4,6 +4,8 @@ import java.util.{ List => JList, Map => JMap }
 import org.apache.spark.SparkContext
 import org.apache.spark.api.java.JavaSparkContext
 import org.joda.time.{ DateTimeZone, DateTime }
+import org.json4s.DefaultFormats
+import org.json4s.jackson.JsonMethods._
 import org.apache.spark.org.trustedanalytics.sparktk.SparkAliases
 import scala.collection.JavaConverters._
 //import scala.collection.mutable
@@ -18,6 +20,15 @@ object JConvert extends Serializable {
 
   def toScalaVector[T](x: JList[T]): Vector[T] = x.asScala.toVector
 
+  /**
+   * Parses a JSON array of strings into a list, so that python can send a whole list in one py4j call (py4j converts
+   * a python list by adding each item to a java list with a separate gateway call)
+   */
+  def jsonToScalaListString(json: String): List[String] = {
+    implicit val formats = DefaultFormats
+    parse(json).extract[List[String]]
+  }
+
   def toOption[T](item: T) = {
     item match {
       case null | None => None
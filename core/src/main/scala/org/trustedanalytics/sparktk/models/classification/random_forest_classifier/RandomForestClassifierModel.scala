@@ -1,10 +1,12 @@
 package org.trustedanalytics.sparktk.models.classification.random_forest_classifier
 
+import java.nio.ByteBuffer
 import org.apache.spark.SparkContext
 import org.apache.spark.mllib.regression.LabeledPoint
 import org.apache.spark.mllib.tree.RandomForest
 import org.apache.spark.rdd.RDD
 import org.apache.spark.sql.Row
+import org.apache.spark.storage.StorageLevel
 import org.apache.spark.mllib.tree.model.{ RandomForestModel => SparkRandomForestModel }
 import org.trustedanalytics.sparktk.TkContext
 import org.trustedanalytics.sparktk.frame._
@@ -14,8 +16,10 @@ import org.trustedanalytics.sparktk.frame.internal.rdd.{ ScoreAndLabel, RowWrapp
 import org.trustedanalytics.sparktk.saveload.{ SaveLoad, TkSaveLoad, TkSaveableObject }
 import org.apache.commons.lang3.StringUtils
 
-import scala.language.implicitConversions
+import org.json4s.DefaultFormats
 import org.json4s.JsonAST.JValue
+import org.json4s.JsonDSL._
+import org.json4s.jackson.JsonMethods._
 
 object RandomForestClassifierModel extends TkSaveableObject {
 
@@ -102,6 +106,42 @@ object RandomForestClassifierModel extends TkSaveableObject {
       featureSubsetCategory)
   }
 
+  /**
+   * Trains a model from arguments given as one JSON object, so that python clients need a single py4j call rather
+   * than one per argument conversion
+   *
+   * @param frame The frame containing the data to train on
+   * @param argsJson JSON object with the remaining train arguments, keyed by argument name
+   *                 (categoricalFeaturesInfo keys are the feature indices as strings)
+   */
+  def trainFromPython(frame: Frame, argsJson: String): RandomForestClassifierModel = {
+    implicit val formats = DefaultFormats
+    val args = parse(argsJson).extract[RandomForestClassifierTrainArgs]
+    train(frame,
+      args.labelColumn.orNull,
+      args.observationColumns.orNull,
+      toInt("numClasses", args.numClasses),
+      toInt("numTrees", args.numTrees),
+      args.impurity.orNull,
+      toInt("maxDepth", args.maxDepth),
+      toInt("maxBins", args.maxBins),
+      toInt("seed", args.seed),
+      args.categoricalFeaturesInfo.map(_.map {
+        case (feature, arity) =>
+          toInt("categoricalFeaturesInfo feature", BigInt(feature)) -> toInt("categoricalFeaturesInfo arity", arity)
+      }),
+      args.featureSubsetCategory)
+  }
+
+  /**
+   * Narrows a JSON integer argument to an Int, failing (like a mismatched py4j call would) rather than silently
+   * dropping the high bits of values that don't fit
+   */
+  private def toInt(name: String, value: BigInt): Int = {
+    require(value.isValidInt, s"$name must be a 32-bit integer, but was $value")
+    value.toInt
+  }
+
   def loadTkSaveableObject(sc: SparkContext, path: String, formatVersion: Int, tkMetadata: JValue): Any = {
 
     validateFormatVersion(formatVersion, 1)
@@ -163,8 +203,15 @@ case class RandomForestClassifierModel private[random_forest_classifier] (sparkM
                                                                           categoricalFeaturesInfo: Option[Map[Int, Int]],
                                                                           featureSubsetCategory: Option[String]) extends Serializable {
 
-  implicit def rowWrapperToRowWrapperFunctions(rowWrapper: RowWrapper): RowWrapperFunctions = {
-    new RowWrapperFunctions(rowWrapper)
+  /**
+   * The categorical features info as a JSON object of feature index to arity, or "null" if there is none
+   * (lets python clients get the whole map with a single py4j call)
+   */
+  def categoricalFeaturesInfoJson: String = {
+    categoricalFeaturesInfo match {
+      case Some(info) => compact(render(info.map { case (feature, arity) => feature.toString -> arity }))
+      case None => "null"
+    }
   }
 
   /**
@@ -180,16 +227,36 @@ case class RandomForestClassifierModel private[random_forest_classifier] (sparkM
     }
 
     val rfColumns = columns.getOrElse(observationColumns)
+    // ship the forest to each executor once, rather than serializing it into the closure of every task
+    val broadcastModel = frame.rdd.sparkContext.broadcast(sparkModel)
     //predicting a label for the observation columns
     val predictMapper: RowWrapper => Row = row => {
       val point = row.toDenseVector(rfColumns)
-      val prediction = sparkModel.predict(point).toInt
+      val prediction = broadcastModel.value.predict(point).toInt
       Row.apply(prediction)
     }
 
     frame.addColumns(predictMapper, Seq(Column("predicted_class", DataTypes.int32)))
   }
 
+  /**
+   * Same as predict, but also returns the predicted classes in row order, packed as big-endian 32-bit ints into one
+   * byte array (which py4j hands to python as a single binary payload, instead of the column being read back per row)
+   *
+   * @param frame - frame to add predictions to
+   * @param columns Column(s) containing the observations whose labels are to be predicted.
+   *                By default, we predict the labels over columns the RandomForestClassifierModel
+   * @return the predicted classes
+   */
+  def predictAsBytes(frame: Frame, columns: Option[List[String]] = None): Array[Byte] = {
+    predict(frame, columns)
+    val predictedClassIndex = frame.schema.columnIndex("predicted_class")
+    val predictions = frame.rdd.map(row => row.getInt(predictedClassIndex)).collect()
+    val buffer = ByteBuffer.allocate(4 * predictions.length)
+    predictions.foreach(prediction => buffer.putInt(prediction))
+    buffer.array()
+  }
+
   /**
    * Get the predictions for observations in a test frame
    *
@@ -207,19 +274,62 @@ case class RandomForestClassifierModel private[random_forest_classifier] (sparkM
 
     //predicting and testing
     val frameRdd = new FrameRdd(frame.schema, frame.rdd)
+    // local copies, so the closure doesn't capture this model (and with it the forest)
+    val broadcastModel = frameRdd.sparkContext.broadcast(sparkModel)
+    val label = labelColumn
     val scoreAndLabelRdd = frameRdd.toScoreAndLabelRdd(row => {
-      val labeledPoint = row.valuesAsLabeledPoint(rfColumns, labelColumn)
-      val score = sparkModel.predict(labeledPoint.features)
+      val labeledPoint = new RowWrapperFunctions(row).valuesAsLabeledPoint(rfColumns, label)
+      val score = broadcastModel.value.predict(labeledPoint.features)
       ScoreAndLabel(score, labeledPoint.label)
     })
 
-    val output: ClassificationMetricValue = numClasses match {
+    classificationMetrics(scoreAndLabelRdd)
+  }
+
+  /**
+   * Adds the predicted_class column to the frame (see predict) and gets the test metrics (see test) from that column,
+   * so the python client makes one call and each observation goes through the forest only once.  The predicted rows
+   * are persisted and become the frame's data, so the metrics job and later reads of the frame share that one pass
+   *
+   * @param frame Frame to add predictions to and test the RandomForestClassifier model with
+   * @param columns Column(s) containing the observations whose labels are to be predicted.
+   *                By default, we predict the labels over columns the RandomForestClassifierModel
+   * @return ClassificationMetricValue describing the test metrics
+   */
+  def predictAndTest(frame: Frame, columns: Option[List[String]] = None): ClassificationMetricValue = {
+    predict(frame, columns)
+    // addColumns is a lazy map, so without persisting it the forest would run again on every later read of the frame
+    frame.init(frame.rdd.persist(StorageLevel.MEMORY_AND_DISK), frame.schema)
+
+    val frameRdd = new FrameRdd(frame.schema, frame.rdd)
+    val label = labelColumn
+    val scoreAndLabelRdd = frameRdd.toScoreAndLabelRdd(row => {
+      ScoreAndLabel(row.doubleValue("predicted_class"), row.doubleValue(label))
+    })
+    classificationMetrics(scoreAndLabelRdd)
+  }
+
+  /**
+   * Same as test, but returns the metrics as JSON (see ClassificationMetricValue.toJson) for python clients
+   */
+  def testAsJson(frame: Frame, columns: Option[List[String]]): String = {
+    test(frame, columns).toJson
+  }
+
+  /**
+   * Same as predictAndTest, but returns the metrics as JSON (see ClassificationMetricValue.toJson) for python clients
+   */
+  def predictAndTestAsJson(frame: Frame, columns: Option[List[String]] = None): String = {
+    predictAndTest(frame, columns).toJson
+  }
+
+  private def classificationMetrics(scoreAndLabelRdd: RDD[ScoreAndLabel[Double]]): ClassificationMetricValue = {
+    numClasses match {
       case 2 =>
         val posLabel = 1d
         ClassificationMetricsFunctions.binaryClassificationMetrics(scoreAndLabelRdd, posLabel)
       case _ => ClassificationMetricsFunctions.multiclassClassificationMetrics(scoreAndLabelRdd)
     }
-    output
   }
 
   /**
@@ -244,6 +354,24 @@ case class RandomForestClassifierModel private[random_forest_classifier] (sparkM
   }
 }
 
+/**
+ * Arguments for RandomForestClassifierModel.trainFromPython, see RandomForestClassifierModel.train
+ *
+ * Arguments that python may send as null are options, and integers are BigInts, so that trainFromPython can check
+ * them and fail with the same messages as train (json4s would otherwise fail to map the nulls, and narrow the
+ * integers to 32 bits without an error)
+ */
+case class RandomForestClassifierTrainArgs(labelColumn: Option[String],
+                                           observationColumns: Option[List[String]],
+                                           numClasses: BigInt,
+                                           numTrees: BigInt,
+                                           impurity: Option[String],
+                                           maxDepth: BigInt,
+                                           maxBins: BigInt,
+                                           seed: BigInt,
+                                           categoricalFeaturesInfo: Option[Map[String, BigInt]],
+                                           featureSubsetCategory: Option[String])
+
 /**
  * TK Metadata that will be stored as part of the model
  * @param labelColumn Column name containing the label for each observation
@@ -50,3 +50,19 @@ def test_random_forest_classifier(tc):
     assert(metrics.f_measure == 1.0)
     assert(metrics.precision == 1.0)
     assert(metrics.recall == 1.0)
+
+    logger.info("predicting and testing in one call")
+    g = tc.frame.create(data, schema=schema)
+    metrics = model.predict_and_test(g)
+    assert(set(g.column_names) == set(['Class', 'Dim_1', 'Dim_2','predicted_class']))
+    assert(g.take(g.row_count).data == f.take(f.row_count).data)
+    assert(metrics.accuracy == 1.0)
+    assert(metrics.f_measure == 1.0)
+    assert(metrics.precision == 1.0)
+    assert(metrics.recall == 1.0)
+
+    logger.info("predicting and returning the predictions")
+    h = tc.frame.create(data, schema=schema)
+    predictions = model.predict(h, return_predictions=True)
+    assert(list(predictions) == [row[3] for row in h.take(h.row_count).data])
+    assert(list(predictions) == [row[0] for row in data])
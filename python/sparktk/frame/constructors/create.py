@@ -1,4 +1,16 @@
 from sparktk.lazyloader import implicit
+from sparktk import dtypes
+import numpy as np
+import re
+import logging
+logger = logging.getLogger('sparktk')
+
+# lists with at least this many cells are validated one column at a time on the client, instead of row by row in a
+# spark job, since whole-column checks and numpy casts are much cheaper than casting each cell in the interpreter
+_COLUMNAR_VALIDATION_THRESHOLD = 10000
+
+# strings that int() parses the same way pandas.to_numeric does, see _parse_numeric_column
+_integer_string = re.compile(r'[+-]?[0-9]+\Z')
 
 def create(data, schema=None, validate_schema=False, tc=implicit):
     """
@@ -101,4 +113,255 @@ def create(data, schema=None, validate_schema=False, tc=implicit):
     if tc is implicit:
         implicit.error('tc')    
     from sparktk.frame.frame import Frame
+    if isinstance(data, list) and _is_column_names(schema):
+        inferred_schema = _infer_schema_fast(data, schema or [])
+        # anything unusual (like an unsupported type) is left for the Frame constructor to infer again and report
+        if _is_complete_schema(inferred_schema):
+            schema = inferred_schema
+    if validate_schema and _is_large_list(data):
+        validated = _validate_columns(data, schema)
+        if validated is not None:
+            data, schema = validated
+            validate_schema = False
     return Frame(tc, data, schema, validate_schema)
+
+
+def _is_large_list(data):
+    """True if data is a list of rows with enough cells to be worth validating column by column"""
+    return isinstance(data, list) and len(data) > 0 and isinstance(data[0], (list, tuple)) and \
+        len(data) * len(data[0]) >= _COLUMNAR_VALIDATION_THRESHOLD
+
+
+def _validate_columns(data, schema):
+    """
+    Validates the data against the schema one column at a time.
+
+    The rows are copied into one 2D numpy object array (copying references, not values), so each column is a view
+    that can be cast and then written back in place, without transposing the data into columns and back into rows.
+
+    :param data: list of rows
+    :param schema: schema (list of tuples of string column names and data type)
+    :return: tuple of the validated rows and the schema, or None if the data or schema can't be handled column by
+             column, in which case the Frame constructor validates (and reports errors for) it row by row
+    """
+    if not _is_complete_schema(schema) or any(type(data_type) is dtypes.vector for name, data_type in schema):
+        return None
+    if all(data_type in [int, long, float] for name, data_type in schema) and \
+            all(type(value) in [int, long, float] for value in data[0]):
+        validated = _validate_numeric_table(data, schema)
+        if validated is not None:
+            return validated
+    try:
+        table = np.asarray(data, dtype=object)
+    except ValueError:
+        return None
+    if table.ndim != 2 or table.shape[1] != len(schema):
+        # rows have different lengths, or their values are sequences themselves
+        return None
+
+    bad_value_count = 0
+    for i, (name, data_type) in enumerate(schema):
+        validated_values, bad_values = _cast_column(table[:, i], data_type)
+        table[:, i] = validated_values
+        bad_value_count += bad_values
+    logger.debug("%s values were unable to be parsed to the schema's data type." % bad_value_count)
+    return table.tolist(), schema
+
+
+def _validate_numeric_table(data, schema):
+    """
+    Validates data made up only of ints and floats (like a feature matrix) against a schema of only int and float
+    columns.  numpy converts the whole list into a single int64 or float64 array, and each column is then cast with
+    plain numeric array operations, skipping the object array and per-value type checks entirely.
+
+    :return: tuple of the validated rows and the schema, or None if the data does not convert to a 2D int64 or float64
+             array matching the schema (or has ints too large to go through float64 exactly)
+    """
+    try:
+        numbers = np.asarray(data)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if numbers.ndim != 2 or numbers.shape[1] != len(schema) or numbers.dtype.kind not in 'if':
+        return None
+    is_float_table = numbers.dtype.kind == 'f'
+    finite = np.isfinite(numbers) if is_float_table else np.ones(numbers.shape, dtype=bool)
+
+    table = np.empty(numbers.shape, dtype=object)
+    for i, (name, data_type) in enumerate(schema):
+        column = numbers[:, i]
+        if data_type is float:
+            table[:, i] = column.astype(np.float64).tolist()
+        elif is_float_table:
+            if np.any(np.abs(column[finite[:, i]]) >= 2 ** 53):
+                return None
+            table[:, i] = map(data_type, np.trunc(np.where(finite[:, i], column, 0)).astype(np.int64).tolist())
+        else:
+            # tolist gives longs for the whole table if the data had any long, so cast to the column's int or long
+            table[:, i] = map(data_type, column.tolist())
+    table[~finite] = None
+    return table.tolist(), schema
+
+
+def _is_column_names(schema):
+    """True if the schema still needs its data types inferred (it is None or just a list of column names)"""
+    return schema is None or (isinstance(schema, list) and all(isinstance(item, basestring) for item in schema))
+
+
+def _is_complete_schema(schema):
+    """True if the schema is a list of (str, data type) tuples, with data types that _cast_column supports"""
+    return isinstance(schema, list) and all(isinstance(item, tuple) and len(item) == 2 and
+                                            isinstance(item[0], str) and _is_supported_type(item[1])
+                                            for item in schema)
+
+
+def _is_supported_type(data_type):
+    """True if data_type is one of the data types a frame can be created with"""
+    return data_type in [int, float, long, str, unicode, dtypes.datetime] or type(data_type) is dtypes.vector
+
+
+# most general data type for the common sets of python types found in a column, see _infer_schema_fast
+_promoted_types = {
+    frozenset([int]): int,
+    frozenset([long]): long,
+    frozenset([float]): float,
+    frozenset([int, long]): long,
+    frozenset([int, float]): float,
+    frozenset([long, float]): float,
+    frozenset([int, long, float]): float,
+    frozenset([str]): str,
+    frozenset([unicode]): unicode,
+    frozenset([str, unicode]): unicode,
+}
+
+
+def _infer_schema_fast(rows, column_names=[], sample_size=100):
+    """
+    Infers the schema from the first sample_size rows, with the same rules as the Frame constructor: None counts as
+    int, lists are vectors, and each column gets the most general data type found in it.
+
+    Rather than merging data types cell by cell, this collects the set of python types seen in each column and then
+    promotes each set once (usually just a lookup in _promoted_types).  Columns with any other mix of types are merged
+    value by value in row order, like the Frame constructor does.
+
+    :param rows: list of rows
+    :param column_names: names for the columns; columns past the end of this list are numbered like C0, C1, etc
+    :param sample_size: number of rows to check
+    :return: schema
+    """
+    sample = rows[:sample_size]
+    column_types = []
+    for row_index, row in enumerate(sample):
+        if row_index == 0:
+            column_types = [set() for value in row]
+        elif len(row) != len(column_types):
+            raise ValueError("Length of each row must be the same (found rows with lengths: %s and %s)." %
+                             (len(column_types), len(row)))
+        for i, value in enumerate(row):
+            column_types[i].add(type(value))
+
+    schema = []
+    for i, value_types in enumerate(column_types):
+        if type(None) in value_types:
+            value_types.discard(type(None))
+            value_types.add(int)
+        data_type = _promoted_types.get(frozenset(value_types))
+        if data_type is None:
+            # merge_types is not associative, so merge in row order like the Frame constructor does
+            data_type = reduce(dtypes.dtypes.merge_types, [_infer_type(row[i]) for row in sample])
+        column_name = column_names[i] if len(column_names) > i else "C%s" % i
+        schema.append((column_name, data_type))
+    return schema
+
+
+def _infer_type(value):
+    """Data type of a single value, with the Frame constructor's rules (None is int, lists are vectors)"""
+    if value is None:
+        return int
+    if isinstance(value, list):
+        return dtypes.vector(len(value))
+    return type(value)
+
+
+def _cast_column(values, data_type):
+    """
+    Casts the values of a column to the data type, using None for values that cannot be cast.
+
+    Columns which already hold only the data type (or None) are returned as is, float columns of plain numbers are cast
+    by numpy in one shot, int and float columns which also hold strings are parsed by pandas in one shot, and anything
+    else falls back to casting each value with dtypes.cast.
+
+    :return: tuple of the cast values and the number of values which could not be cast
+    """
+    value_types = set(map(type, values))
+    value_types.discard(type(None))
+    if data_type is not float and value_types <= set([data_type]):
+        return values, 0
+    if data_type is float and value_types <= set([int, long, float, bool]):
+        try:
+            array = np.array(values, dtype=np.float64)  # None becomes nan here, so it is caught as missing below
+        except (OverflowError, ValueError):
+            array = None  # like longs too large for a float, which are left for dtypes.cast to report below
+        if array is not None:
+            cast_values = array.tolist()
+            for i in np.flatnonzero(~np.isfinite(array)):
+                cast_values[i] = None
+            return cast_values, 0
+    if data_type in [int, long, float] and value_types <= set([int, long, float, str, unicode]):
+        result = _parse_numeric_column(values, data_type)
+        if result is not None:
+            return result
+
+    cast_values = []
+    bad_value_count = 0
+    for value in values:
+        try:
+            cast_values.append(dtypes.dtypes.cast(value, data_type))
+        except:
+            cast_values.append(None)
+            bad_value_count += 1
+    return cast_values, bad_value_count
+
+
+def _parse_numeric_column(values, data_type):
+    """
+    Casts a column of numbers and numeric strings to int or float with pandas.to_numeric, so strings are parsed by
+    pandas in C rather than one at a time by the interpreter.  Like dtypes.cast, missing and non-finite values become
+    None and ints truncate floats.  Strings that pandas can't parse, and strings for an int column that aren't plain
+    integers (like "3.0" or "1e3", which int() rejects), are cast with dtypes.cast instead, so they become None (and
+    are counted as bad) exactly when they would have been without pandas.
+
+    :return: tuple of the cast values and the number of values which could not be cast, or None if pandas could not
+             produce a plain numeric array, or if an int column has values too large to go through float64 exactly
+    """
+    import pandas
+    objects = np.array(values, dtype=object)
+    try:
+        numbers = pandas.to_numeric(objects, errors='coerce')
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if numbers.dtype.kind not in 'if':
+        return None
+    array = numbers.astype(np.float64)
+    if data_type is not float and numbers.dtype.kind == 'f' and np.any(np.abs(array[np.isfinite(array)]) >= 2 ** 53):
+        return None
+    # strings like "x" and "nan" come back as nan, and are left for dtypes.cast to decide on
+    recast = np.isnan(array) & ~pandas.isnull(objects)
+    if data_type is float:
+        cast_values = array.tolist()
+    else:
+        recast |= np.array([type(value) in (str, unicode) and _integer_string.match(value) is None for value in values],
+                           dtype=bool)
+        # whole numbers are kept exactly when pandas parsed everything as int64; like dtypes.cast, a long column gets
+        # longs and an int column gets ints
+        cast_values = map(data_type, numbers.tolist() if numbers.dtype.kind == 'i' else
+                          np.trunc(np.where(np.isfinite(array), array, 0)).astype(np.int64).tolist())
+    for i in np.flatnonzero(~np.isfinite(array)):
+        cast_values[i] = None
+    bad_value_count = 0
+    for i in np.flatnonzero(recast):
+        try:
+            cast_values[i] = dtypes.dtypes.cast(values[i], data_type)
+        except:
+            cast_values[i] = None
+            bad_value_count += 1
+    return cast_values, bad_value_count
@@ -186,10 +186,13 @@ class Frame(object):
         return self.create_scala_frame(self._tc.sc, scala_rdd, scala_schema)
 
     def _is_scala_frame(self, item):
-        return self._tc._jutils.is_jvm_instance_of(item, self._tc.sc._jvm.org.trustedanalytics.sparktk.frame.Frame)
+        # check for a java object first, so python data (like the list given to create) skips the py4j class lookup
+        return self._tc._jutils.is_java(item) and \
+            self._tc._jutils.is_jvm_instance_of(item, self._tc.sc._jvm.org.trustedanalytics.sparktk.frame.Frame)
 
     def is_scala_rdd(self, item):
-        return self._tc._jutils.is_jvm_instance_of(item, self._tc.sc._jvm.org.apache.spark.rdd.RDD)
+        return self._tc._jutils.is_java(item) and \
+            self._tc._jutils.is_jvm_instance_of(item, self._tc.sc._jvm.org.apache.spark.rdd.RDD)
 
     def is_python_rdd(self, item):
         return isinstance(item, RDD)
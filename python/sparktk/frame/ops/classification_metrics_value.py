@@ -1,4 +1,5 @@
 import pandas as pd
+import json
 from sparktk.propobj import PropertiesObject
 
 class ClassificationMetricsValue(PropertiesObject):
@@ -11,13 +12,10 @@ class ClassificationMetricsValue(PropertiesObject):
         self._accuracy = scala_result.accuracy()
         cm = scala_result.confusionMatrix()
         if cm:
-            self._confusion_matrix = cm
             column_list = self._tc.jutils.convert.from_scala_seq(cm.columnLabels())
             row_label_list = self._tc.jutils.convert.from_scala_seq(cm.rowLabels())
-            header = ["Predicted_" + column.title() for column in column_list]
-            row_index = ["Actual_" + row_label.title() for row_label in row_label_list]
             data = [list(x) for x in list(cm.getMatrix())]
-            self._confusion_matrix = pd.DataFrame(data, index=row_index, columns=header)
+            self._confusion_matrix = self._to_pandas_confusion_matrix(row_label_list, column_list, data)
         else:
             #empty pandas frame
             self._confusion_matrix = pd.DataFrame()
@@ -26,6 +24,40 @@ class ClassificationMetricsValue(PropertiesObject):
         self._precision = scala_result.precision()
         self._recall = scala_result.recall()
 
+    @staticmethod
+    def from_json(tc, json_str):
+        """
+        Creates a ClassificationMetricsValue from the JSON of a scala ClassificationMetricValue (see its toJson), which
+        takes a single py4j call instead of one for each metric and for each part of the confusion matrix
+        """
+        metrics = json.loads(json_str)
+        result = ClassificationMetricsValue.__new__(ClassificationMetricsValue)
+        result._tc = tc
+        result._accuracy = ClassificationMetricsValue._from_json_metric(metrics["accuracy"])
+        cm = metrics["confusionMatrix"]
+        if cm:
+            result._confusion_matrix = ClassificationMetricsValue._to_pandas_confusion_matrix(cm["rowLabels"],
+                                                                                              cm["columnLabels"],
+                                                                                              cm["matrix"])
+        else:
+            #empty pandas frame
+            result._confusion_matrix = pd.DataFrame()
+        result._f_measure = ClassificationMetricsValue._from_json_metric(metrics["fMeasure"])
+        result._precision = ClassificationMetricsValue._from_json_metric(metrics["precision"])
+        result._recall = ClassificationMetricsValue._from_json_metric(metrics["recall"])
+        return result
+
+    @staticmethod
+    def _from_json_metric(value):
+        """non-finite metrics (like the NaN precision of an empty frame) are null in the JSON, and come back as nan"""
+        return float('nan') if value is None else value
+
+    @staticmethod
+    def _to_pandas_confusion_matrix(row_label_list, column_list, data):
+        header = ["Predicted_" + column.title() for column in column_list]
+        row_index = ["Actual_" + row_label.title() for row_label in row_label_list]
+        return pd.DataFrame(data, index=row_index, columns=header)
+
     @property
     def accuracy(self):
         return self._accuracy
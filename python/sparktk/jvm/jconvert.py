@@ -1,4 +1,5 @@
 from sparktk.dtypes import dtypes
+import json
 
 
 class JConvert(object):
@@ -8,6 +9,7 @@ class JConvert(object):
         self.jutils = jutils
         self.sc = jutils.sc
         self.scala = self.sc._jvm.org.trustedanalytics.sparktk.jvm.JConvert
+        self._scala_none = None
 
     def list_to_double_list(self, python_list):
         return [float(item) for item in python_list]
@@ -21,6 +23,10 @@ class JConvert(object):
     def to_scala_list_string(self, python_list):
         return self.scala.toScalaList([unicode(item) for item in python_list])
 
+    def to_scala_list_string_bulk(self, python_list):
+        """same as to_scala_list_string, but sends the whole list to the JVM in one py4j call rather than one per item"""
+        return self.scala.jsonToScalaListString(json.dumps([unicode(item) for item in python_list]))
+
     def to_scala_list_string_bool_tuple(self, python_list):
         return self.scala.toScalaList([self.scala.toScalaTuple2(unicode(item[0]), item[1]) for item in python_list])
 
@@ -47,8 +53,17 @@ class JConvert(object):
         return self.scala.scalaMapToPython(m)
 
     def to_scala_option(self, item):
+        if item is None:
+            return self.scala_none
         return self.scala.toOption(item)
 
+    @property
+    def scala_none(self):
+        """scala's None, fetched from the JVM on first use and then reused (it is a singleton)"""
+        if self._scala_none is None:
+            self._scala_none = self.scala.toOption(None)
+        return self._scala_none
+
     def to_scala_option_list_double(self, python_list):
         if isinstance(python_list, list):
             python_list = self.list_to_double_list(python_list)
@@ -1,9 +1,10 @@
 from sparktk.loggers import log_load; log_load(__name__); del log_load
 
-from sparktk.propobj import PropertiesObject
-from sparktk.frame.ops.classification_metrics_value import ClassificationMetricsValue
+from sparktk.propobj import PropertiesObject, cached_property
 from sparktk.lazyloader import implicit
-import os
+import json as _json
+import random as _random
+import weakref as _weakref
 
 def train(frame,
           label_column,
@@ -55,25 +56,21 @@ def train(frame,
     """
     tc = frame._tc
     _scala_obj = get_scala_obj(tc)
-    seed = int(os.urandom(2).encode('hex'), 16) if seed is None else seed
-    scala_model = _scala_obj.train(frame._scala,
-                                   label_column,
-                                   tc.jutils.convert.to_scala_list_string(observation_columns),
-                                   num_classes,
-                                   num_trees,
-                                   impurity,
-                                   max_depth,
-                                   max_bins,
-                                   seed,
-                                   __get_categorical_features_info(tc, categorical_features_info),
-                                   tc.jutils.convert.to_scala_option(feature_subset_category))
-
-    return RandomForestClassifierModel(tc, scala_model)
-
-def __get_categorical_features_info(tc, c):
-    if c is not None:
-        c = tc.jutils.convert.to_scala_map(c)
-    return tc.jutils.convert.to_scala_option(c)
+    seed = _random.getrandbits(31) if seed is None else seed
+    args = {"labelColumn": label_column,
+            "observationColumns": observation_columns,
+            "numClasses": num_classes,
+            "numTrees": num_trees,
+            "impurity": impurity,
+            "maxDepth": max_depth,
+            "maxBins": max_bins,
+            "seed": seed,
+            "categoricalFeaturesInfo": categorical_features_info,
+            "featureSubsetCategory": feature_subset_category}
+    # all arguments go over as one JSON string, instead of converting each to its scala type with separate py4j calls
+    scala_model = _scala_obj.trainFromPython(frame._scala, _json.dumps(args))
+
+    return RandomForestClassifierModel._trusted(tc, scala_model)
 
 
 def load(path, tc=implicit):
@@ -83,9 +80,17 @@ def load(path, tc=implicit):
     return tc.load(path, RandomForestClassifierModel)
 
 
+# scala object reference per TkContext, since resolving it through the py4j jvm view costs gateway round trips
+_scala_obj_cache = _weakref.WeakKeyDictionary()
+
+
 def get_scala_obj(tc):
     """Gets reference to the scala object"""
-    return tc.sc._jvm.org.trustedanalytics.sparktk.models.classification.random_forest_classifier.RandomForestClassifierModel
+    scala_obj = _scala_obj_cache.get(tc)
+    if scala_obj is None:
+        scala_obj = tc.sc._jvm.org.trustedanalytics.sparktk.models.classification.random_forest_classifier.RandomForestClassifierModel
+        _scala_obj_cache[tc] = scala_obj
+    return scala_obj
 
 
 class RandomForestClassifierModel(PropertiesObject):
@@ -150,86 +155,126 @@ class RandomForestClassifierModel(PropertiesObject):
 
     """
 
+    __slots__ = ('_tc', '_scala', '_cache')
+
     def __init__(self, tc, scala_model):
-        self._tc = tc
         tc.jutils.validate_is_jvm_instance_of(scala_model, get_scala_obj(tc))
+        self._init(tc, scala_model)
+
+    def _init(self, tc, scala_model):
+        self._tc = tc
         self._scala = scala_model
+        self._cache = {}
+
+    @staticmethod
+    def _trusted(tc, scala_model):
+        """
+        Creates the model without validating the type of scala_model over py4j, for scala models that are known to be
+        RandomForestClassifierModels (like those just returned by train or dispatched to _from_scala by load)
+        """
+        model = RandomForestClassifierModel.__new__(RandomForestClassifierModel)
+        model._init(tc, scala_model)
+        return model
 
     @staticmethod
     def _from_scala(tc, scala_model):
         """Loads a random forest classifier model from a scala model"""
-        return RandomForestClassifierModel(tc, scala_model)
+        return RandomForestClassifierModel._trusted(tc, scala_model)
 
-    @property
+    @cached_property
     def label_column(self):
         """column containing the label used for model training"""
         return self._scala.labelColumn()
 
-    @property
+    @cached_property
     def observation_columns(self):
         """observation columns used for model training"""
-        return self._tc.jutils.convert.from_scala_seq(self._scala.observationColumns())
+        return tuple(self._tc.jutils.convert.from_scala_seq(self._scala.observationColumns()))
 
-    @property
+    @cached_property
     def num_classes(self):
         """number of classes in the trained model"""
         return self._scala.numClasses()
 
-    @property
+    @cached_property
     def num_trees(self):
         """number of trees in the trained model"""
         return self._scala.numTrees()
 
-    @property
+    @cached_property
     def impurity(self):
         """impurity value of the trained model"""
         return self._scala.impurity()
 
-    @property
+    @cached_property
     def max_depth(self):
         """maximum depth of the trained model"""
         return self._scala.maxDepth()
 
-    @property
+    @cached_property
     def max_bins(self):
         """maximum bins in the trained model"""
         return self._scala.maxBins()
 
-    @property
+    @cached_property
     def seed(self):
         """seed used during training of the model"""
         return self._scala.seed()
 
-    @property
+    @cached_property
     def categorical_features_info(self):
         """categorical feature dictionary used during model training"""
-        s = self._tc.jutils.convert.from_scala_option(self._scala.categoricalFeaturesInfo())
-        if s:
-            return self._tc.jutils.convert.scala_map_to_python(s)
+        s = _json.loads(self._scala.categoricalFeaturesInfoJson())
+        if s is not None:
+            return dict([(int(k), v) for k, v in s.items()])
         return None
 
-    @property
+    @cached_property
     def feature_subset_category(self):
         """feature subset category of the trained model"""
         return self._tc.jutils.convert.from_scala_option(self._scala.featureSubsetCategory())
 
-    def predict(self, frame, columns=None):
-        """predict the frame given the trained model"""
+    def predict(self, frame, columns=None, return_predictions=False):
+        """
+        predict the frame given the trained model
+
+        :param frame: (Frame) frame to add the predicted_class column to
+        :param columns: (Optional(list(str))) observation columns to predict from.  Default is the observation columns
+                        used for training
+        :param return_predictions: (bool) when True, also return the predicted classes, in row order, as a numpy int32
+                                   array.  They come from the JVM as a single byte buffer, which is much cheaper than
+                                   reading the new column back through the frame.  Default is False
+        :return: (Optional(numpy.ndarray)) the predicted classes, if return_predictions is True
+        """
         c = self.__columns_to_option(columns)
+        if return_predictions:
+            import numpy as np
+            return np.frombuffer(self._scala.predictAsBytes(frame._scala, c), dtype='>i4').astype(np.int32)
         self._scala.predict(frame._scala, c)
 
     def test(self, frame, columns=None):
         """test the frame given the trained model"""
+        from sparktk.frame.ops.classification_metrics_value import ClassificationMetricsValue
+        c = self.__columns_to_option(columns)
+        return ClassificationMetricsValue.from_json(self._tc, self._scala.testAsJson(frame._scala, c))
+
+    def predict_and_test(self, frame, columns=None):
+        """
+        predict the frame given the trained model (adding the predicted_class column) and test the predictions,
+        in one call, instead of calling predict and then test.  The predicted frame is persisted, so the test and later
+        operations on the frame reuse the predictions instead of running the forest again
+        """
+        from sparktk.frame.ops.classification_metrics_value import ClassificationMetricsValue
         c = self.__columns_to_option(columns)
-        return ClassificationMetricsValue(self._tc, self._scala.test(frame._scala, c))
+        return ClassificationMetricsValue.from_json(self._tc, self._scala.predictAndTestAsJson(frame._scala, c))
 
     def __columns_to_option(self, c):
-        if c is not None:
-            c = self._tc.jutils.convert.to_scala_list_string(c)
-        return self._tc.jutils.convert.to_scala_option(c)
+        if c is None:
+            return self._tc.jutils.convert.scala_none
+        return self._tc.jutils.convert.to_scala_option(self._tc.jutils.convert.to_scala_list_string_bulk(c))
 
     def save(self, path):
         """save the trained model to path"""
         self._scala.save(self._tc._scala_sc, path)
 
-del PropertiesObject
+del PropertiesObject, cached_property
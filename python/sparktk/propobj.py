@@ -1,9 +1,12 @@
 import json
+import functools
 
 
 class PropertiesObject(object):
     """Simple object which provides nice repr, to_dict, etc. for attributes and properties"""
 
+    __slots__ = ()  # lets subclasses define __slots__ of their own and go without a __dict__
+
     def to_dict(self):
         d = self._properties()
         d.update(self._attributes())
@@ -20,7 +23,7 @@ class PropertiesObject(object):
         return "\n".join(["%s = %s" % (self._pad_right(k, max_len), str(d[k])) for k in sorted(d.keys())])
 
     def _attributes(self):
-        return dict([(k, v) for k, v in self.__dict__.items() if not k.startswith('_')])
+        return dict([(k, v) for k, v in getattr(self, '__dict__', {}).items() if not k.startswith('_')])
 
     def _properties(self):
         class_items = self.__class__.__dict__.iteritems()
@@ -30,3 +33,20 @@ class PropertiesObject(object):
     def _pad_right(s, target_len):
         """pads string s on the right such that is has at least length target_len"""
         return s + ' ' * (target_len - len(s))
+
+
+def cached_property(fget):
+    """
+    Decorator for a read-only property whose value is computed on first access and afterwards returned from the
+    instance's _cache dict (use for values which are expensive to get and never change, like those of a trained model)
+    """
+    name = fget.__name__
+
+    @functools.wraps(fget)
+    def getter(self):
+        try:
+            return self._cache[name]
+        except KeyError:
+            value = self._cache[name] = fget(self)
+            return value
+    return property(getter)
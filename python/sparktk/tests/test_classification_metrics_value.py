@@ -0,0 +1,32 @@
+import json
+import math
+import unittest
+
+from sparktk.frame.ops.classification_metrics_value import ClassificationMetricsValue
+
+
+class TestClassificationMetricsValue(unittest.TestCase):
+
+    def test_from_json(self):
+        metrics = ClassificationMetricsValue.from_json(None, json.dumps({
+            "fMeasure": 0.75, "accuracy": 0.8, "recall": 0.6, "precision": 1.0,
+            "confusionMatrix": {"rowLabels": ["pos", "neg"], "columnLabels": ["pos", "neg"],
+                                "matrix": [[3, 2], [0, 5]]}}))
+        self.assertEqual((metrics.accuracy, metrics.f_measure, metrics.precision, metrics.recall),
+                         (0.8, 0.75, 1.0, 0.6))
+        self.assertEqual(list(metrics.confusion_matrix.columns), ["Predicted_Pos", "Predicted_Neg"])
+        self.assertEqual(list(metrics.confusion_matrix.index), ["Actual_Pos", "Actual_Neg"])
+        self.assertEqual(metrics.confusion_matrix.values.tolist(), [[3, 2], [0, 5]])
+
+    def test_from_json_nulls(self):
+        # non-finite metrics (like the precision of an empty frame) and a missing confusion matrix are null
+        metrics = ClassificationMetricsValue.from_json(None, json.dumps({
+            "fMeasure": None, "accuracy": 0.0, "recall": None, "precision": None, "confusionMatrix": None}))
+        self.assertEqual(metrics.accuracy, 0.0)
+        for value in [metrics.f_measure, metrics.precision, metrics.recall]:
+            self.assertTrue(isinstance(value, float) and math.isnan(value))
+        self.assertTrue(metrics.confusion_matrix.empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+
+import sparktk.frame.constructors.create as c
+
+
+class TestCreate(unittest.TestCase):
+
+    def test_infer_schema_fast(self):
+        data = [["Bob", 30, 8, None, [1.0, 2.0]], ["Jim", 45, 9.5, None, [3.0, 4.0]], [u"Sue", 25, 7, 1L, [5.0, 6.0]]]
+        schema = c._infer_schema_fast(data, ["name", "age"])
+        self.assertEqual(schema[:4], [("name", unicode), ("age", int), ("C2", float), ("C3", long)])
+        self.assertEqual(repr(schema[4][1]), "vector(2)")
+        self.assertEqual(c._infer_schema_fast([[1], ["a"]], sample_size=1), [("C0", int)])
+        self.assertEqual(c._infer_schema_fast([]), [])
+
+    def test_infer_schema_fast_merge_order(self):
+        # merge_types is not associative, so mixed columns are merged in row order, like the Frame constructor does
+        now = c.dtypes.datetime.now()
+        self.assertEqual(c._infer_schema_fast([[now], [1], ["a"]]), [("C0", unicode)])
+        self.assertEqual(c._infer_schema_fast([[1], ["a"], [now]]), [("C0", str)])
+
+    def test_infer_schema_fast_errors(self):
+        self.assertRaises(ValueError, c._infer_schema_fast, [[1, 2], [3]])
+        self.assertRaises(ValueError, c._infer_schema_fast, [[[1, 2]], [[3]]])
+
+    def test_validate_columns(self):
+        data = [["Bob", 30, 8], ["Jim", 45, 9.5], ["Sue", 25, 7]]
+        rows, schema = c._validate_columns(data, [("name", str), ("age", int), ("shoe_size", float)])
+        self.assertEqual(rows, [["Bob", 30, 8.0], ["Jim", 45, 9.5], ["Sue", 25, 7.0]])
+        self.assertTrue(all(isinstance(row[2], float) for row in rows))
+
+    def test_validate_columns_bad_values(self):
+        data = [[1, 2, 3.5], [4, "five", float('nan')]]
+        rows, schema = c._validate_columns(data, [("a", int), ("b", int), ("c", float)])
+        self.assertEqual(rows, [[1, 2, 3.5], [4, None, None]])
+
+    def test_cast_column_float_overflow(self):
+        # longs too large for a float are bad values, like they are for dtypes.cast
+        self.assertEqual(c._cast_column((10 ** 400, 2, None), float), ([None, 2.0, None], 1))
+        rows, schema = c._validate_columns([[10 ** 400, 1.5]] * 3, [("a", float), ("b", float)])
+        self.assertEqual(rows, [[None, 1.5]] * 3)
+
+    def test_cast_column_numeric_strings(self):
+        values = (1, "2", "3.5", "x", None, 4.9, float('inf'))
+        self.assertEqual(c._cast_column(values, int), ([1, 2, None, None, None, 4, None], 2))
+        self.assertEqual(c._cast_column(values, float), ([1.0, 2.0, 3.5, None, None, 4.9, None], 1))
+        # strings are cast like int() and float() would, so "3.0" isn't an int and "nan" is a missing float
+        values = ("3.0", "1e3", "inf", "nan", " 7 ", "+8", 9)
+        self.assertEqual(c._cast_column(values, int), ([None, None, None, None, 7, 8, 9], 4))
+        self.assertEqual(c._cast_column(values, float), ([3.0, 1000.0, None, None, 7.0, 8.0, 9.0], 0))
+        self.assertEqual(c._cast_column(("3", "4.0", 2 ** 53 + 1, 2.5), int), ([3, None, 2 ** 53 + 1, 2], 1))
+        self.assertEqual(c._cast_column((10 ** 400, "1"), float), ([None, 1.0], 1))
+
+    def test_cast_column_matches_dtypes_cast(self):
+        values = [1, "2", "3.0", "1e3", "inf", "-inf", "nan", "x", "", None, 4.9, float('nan'), " 5", u"6", 2 ** 60]
+        for data_type in [int, float]:
+            expected = []
+            for value in values:
+                try:
+                    expected.append(c.dtypes.dtypes.cast(value, data_type))
+                except ValueError:
+                    expected.append(None)
+            self.assertEqual(c._cast_column(tuple(values), data_type)[0], expected)
+
+    def test_validate_numeric_table(self):
+        data = [[1, 2.5], [3, float('nan')], [4.9, 5]]
+        rows, schema = c._validate_numeric_table(data, [("a", int), ("b", float)])
+        self.assertEqual(rows, [[1, 2.5], [3, None], [4, 5.0]])
+        self.assertTrue(all(isinstance(row[1], float) for row in rows if row[1] is not None))
+        self.assertIsNone(c._validate_numeric_table([[1, "x"], [3, 4]], [("a", int), ("b", float)]))
+        self.assertIsNone(c._validate_numeric_table([[1, 2], [3, 4]], [("a", int)]))
+
+    def test_validate_columns_int_and_long_types(self):
+        # like dtypes.cast, int columns get ints and long columns get longs, whatever the other cells hold
+        schema = [("a", int), ("b", int), ("c", long), ("d", long)]
+        for data in [[[1, 7L, 2, 3.5]] * 3, [[1, "7", 2, "3"]] * 3, [[1.5, 7L, 2, 3.5]] * 3]:
+            rows, schema = c._validate_columns(data, schema)
+            expected = [[c.dtypes.dtypes.cast(value, data_type) for value, (name, data_type) in zip(row, schema)]
+                        for row in data]
+            self.assertEqual(rows, expected)
+            self.assertEqual([map(type, row) for row in rows], [map(type, row) for row in expected])
+
+    def test_validate_numeric_table_large_ints(self):
+        # 2**53 + 1 rounds to 2**53 in a float64 table, so int columns that large are not cast through it
+        self.assertIsNone(c._validate_numeric_table([[2 ** 53 + 1, 0.5]] * 3, [("a", int), ("b", float)]))
+        self.assertIsNone(c._validate_numeric_table([[2 ** 53, 0.5]] * 3, [("a", int), ("b", float)]))
+        rows, schema = c._validate_numeric_table([[2 ** 53 - 1, 0.5]] * 3, [("a", int), ("b", float)])
+        self.assertEqual(rows, [[2 ** 53 - 1, 0.5]] * 3)
+        rows, schema = c._validate_columns([[2 ** 53 + 1, 0.5]] * 3, [("a", int), ("b", float)])
+        self.assertEqual(rows, [[2 ** 53 + 1, 0.5]] * 3)
+
+    def test_validate_columns_fallback(self):
+        # rows of different lengths and invalid schemas are left for the Frame constructor to report
+        self.assertIsNone(c._validate_columns([[1, 2], [3]], [("a", int), ("b", int)]))
+        self.assertIsNone(c._validate_columns([[1, 2]], [("a", int)]))
+        self.assertIsNone(c._validate_columns([[1, 2]], [("a", int), ("b", "int")]))
+        self.assertIsNone(c._validate_columns([[1, [2.0, 3.0]]], [("a", int), ("b", c.dtypes.vector(2))]))
+
+
+if __name__ == '__main__':
+    unittest.main()
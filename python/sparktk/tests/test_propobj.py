@@ -0,0 +1,42 @@
+import unittest
+
+from sparktk.propobj import PropertiesObject, cached_property
+
+
+class Slotted(PropertiesObject):
+
+    __slots__ = ('_cache', 'calls')
+
+    def __init__(self):
+        self._cache = {}
+        self.calls = 0
+
+    @cached_property
+    def answer(self):
+        """the answer"""
+        self.calls += 1
+        return 42
+
+
+class TestPropertiesObject(unittest.TestCase):
+
+    def test_cached_property(self):
+        s = Slotted()
+        self.assertEqual(s.answer, 42)
+        self.assertEqual(s.answer, 42)
+        self.assertEqual(s.calls, 1)
+        self.assertEqual(Slotted.answer.__doc__, "the answer")
+
+    def test_cached_property_is_read_only(self):
+        s = Slotted()
+        self.assertRaises(AttributeError, setattr, s, 'answer', 0)
+
+    def test_slots_repr_and_to_dict(self):
+        s = Slotted()
+        self.assertFalse(hasattr(s, '__dict__'))
+        self.assertEqual(s.to_dict(), {'answer': 42})
+        self.assertEqual(repr(s), "answer = 42")
+
+
+if __name__ == '__main__':
+    unittest.main()